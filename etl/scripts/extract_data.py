@@ -1,16 +1,17 @@
 import pandas as pd
 import os
+from schema import read_options
 
 staging_dir = 'data/staging'
 os.makedirs(staging_dir, exist_ok=True)
 
 # ---- Extracting Data ----
-products = pd.read_csv('data/raw/inventory_data.csv')
-sales = pd.read_csv('data/raw/sales_data.csv')
-time = pd.read_csv('data/raw/time_data.csv')
+products = pd.read_csv('data/raw/inventory_data.csv', **read_options('products', 'raw'))
+sales = pd.read_csv('data/raw/sales_data.csv', **read_options('sales', 'raw'))
+time = pd.read_csv('data/raw/time_data.csv', **read_options('time', 'raw'))
 
-customers = pd.read_excel('data/raw/customer_data.xlsx')
-shipping = pd.read_excel('data/raw/shipping_data.xlsx')
+customers = pd.read_excel('data/raw/customer_data.xlsx', **read_options('customers', 'raw'))
+shipping = pd.read_excel('data/raw/shipping_data.xlsx', **read_options('shipping', 'raw'))
 
 # ---- Save Raw Data to Staging Area ----
 
@@ -3,6 +3,7 @@ import mysql.connector
 from mysql.connector import Error
 from dotenv import load_dotenv
 import os
+from schema import TABLES, read_table, rename_map, create_table_sql, add_constraints_sql
 
 load_dotenv()
 DB_HOST = os.getenv('DB_HOST')
@@ -10,46 +11,9 @@ DB_USER = os.getenv('DB_USER')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
 DB_NAME = os.getenv('DB_NAME')
 
-column_mappings = {
-    'Customer_Dim': {
-        'Customer ID': 'CustomerID',
-        'Customer Name': 'CustomerName',
-        'Segment': 'Segment',
-        'City': 'City',
-        'State': 'State',
-        'Country': 'Country',
-        'Region': 'Region'
-    },
-    'Product_Dim': {
-        'Product ID': 'ProductID',
-        'Product Name': 'ProductName',
-        'Category': 'Category',
-        'Sub-Category': 'SubCategory'
-    },
-    'Time_Dim': {
-        'Order Date': 'OrderDate',
-        'order year': 'OrderYear',
-        'order month': 'OrderMonth'
-    },
-    'Shipping_Dim': {
-        'Order ID': 'OrderID',
-        'Ship Date': 'ShipDate',
-        'Ship Mode': 'ShipMode',
-        'Delivery Days': 'DeliveryDays',
-        'Shipping Cost': 'ShippingCost'
-    },
-    'Sales_Fact': {
-        'Order ID': 'OrderID',
-        'Product ID': 'ProductID',
-        'Customer ID': 'CustomerID',
-        'Order Date': 'OrderDate',
-        'Sales': 'Sales',
-        'Profit': 'Profit',
-        'Quantity': 'Quantity',
-        'Discount': 'Discount',
-        'Shipping Cost': 'ShippingCost'
-    }
-}
+# Load Sales_Fact through an unindexed staging table (see bulk_load_data)
+BULK_LOAD = os.getenv('BULK_LOAD', 'false').lower() in ('1', 'true', 'yes')
+BULK_BATCH_SIZE = 10000
 
 def create_connection():
     """Create a database connection to the MySQL database."""
@@ -76,59 +40,12 @@ def check_connection(connection):
 
 def create_tables(connection):
     """Create the dimension and fact tables in the MySQL database."""
-    create_tables_sql = """
-    CREATE TABLE IF NOT EXISTS Customer_Dim (
-        CustomerID VARCHAR(50) PRIMARY KEY,
-        CustomerName VARCHAR(255),
-        Segment VARCHAR(50),
-        City VARCHAR(50),
-        State VARCHAR(50),
-        Country VARCHAR(50),
-        Region VARCHAR(50)
-    );
-
-    CREATE TABLE IF NOT EXISTS Product_Dim (
-        ProductID VARCHAR(50) PRIMARY KEY,
-        ProductName VARCHAR(255),
-        Category VARCHAR(50),
-        SubCategory VARCHAR(50)
-    );
-
-    CREATE TABLE IF NOT EXISTS Time_Dim (
-        OrderDate DATE PRIMARY KEY,
-        OrderYear INT,
-        OrderMonth INT
-    );
-
-    CREATE TABLE IF NOT EXISTS Shipping_Dim (
-        OrderID VARCHAR(50) PRIMARY KEY,
-        ShipDate DATE,
-        ShipMode VARCHAR(50),
-        DeliveryDays INT,
-        ShippingCost DECIMAL(10, 2)
-    );
-
-    CREATE TABLE IF NOT EXISTS Sales_Fact (
-        OrderID VARCHAR(50),
-        ProductID VARCHAR(50),
-        CustomerID VARCHAR(50),
-        OrderDate DATE,
-        Sales DECIMAL(10, 2),
-        Profit DECIMAL(10, 2),
-        Quantity INT,
-        Discount DECIMAL(5, 2),
-        ShippingCost DECIMAL(10, 2),
-        PRIMARY KEY (OrderID, ProductID, CustomerID, OrderDate),
-        FOREIGN KEY (CustomerID) REFERENCES Customer_Dim(CustomerID),
-        FOREIGN KEY (ProductID) REFERENCES Product_Dim(ProductID),
-        FOREIGN KEY (OrderDate) REFERENCES Time_Dim(OrderDate),
-        FOREIGN KEY (OrderID) REFERENCES Shipping_Dim(OrderID)
-    );
-    """
     cursor = None
     try:
         cursor = connection.cursor()
-        cursor.execute(create_tables_sql)
+        # DDL is generated from the schema registry (dimensions before the fact table)
+        for table_name in TABLES:
+            cursor.execute(create_table_sql(table_name))
         print("Tables created successfully")
     except Error as e:
         print(f"Error creating tables: {e}")
@@ -145,15 +62,16 @@ def load_data(connection, table_name, csv_file):
             return
         
         cursor = connection.cursor()
-        df = pd.read_csv(csv_file)
+        # Dates stay as 'YYYY-MM-DD' text, which MySQL DATE columns accept as-is
+        df = read_table(csv_file, table_name, 'transformed', parse_dates=False)
 
         # Debug: Print the original column names
         print(f"Original columns in {csv_file}:")
         print(df.columns)
 
         # Map CSV column names to MySQL column names
-        if table_name in column_mappings:
-            df.rename(columns=column_mappings[table_name], inplace=True)
+        if table_name in TABLES:
+            df.rename(columns=rename_map(table_name), inplace=True)
 
         # Debug: Print the column names after renaming
         print(f"Columns after renaming for {table_name}:")
@@ -195,6 +113,72 @@ def load_data(connection, table_name, csv_file):
         if cursor:
             cursor.close()
 
+def bulk_load_data(connection, table_name, csv_file, batch_size=BULK_BATCH_SIZE):
+    """Bulk-load a table into an unindexed staging copy and swap it in.
+
+    The staging table has no keys and is filled with foreign key and unique
+    checks off. Its primary and foreign keys are then built in a single
+    ALTER TABLE (one sorted index build) and RENAME TABLE atomically replaces
+    the live table, which stays queryable until then. Foreign keys are not
+    re-checked, so only use this after validate_data() has passed.
+    """
+    staging_table = f"{table_name}_staging"
+    old_table = f"{table_name}_old"
+    cursor = None
+    try:
+        connection = check_connection(connection)
+        if connection is None:
+            print(f"Failed to bulk load data into {table_name}: Connection not available")
+            return
+
+        cursor = connection.cursor()
+        # Dates stay as 'YYYY-MM-DD' text, which MySQL DATE columns accept as-is
+        df = read_table(csv_file, table_name, 'transformed', parse_dates=False)
+
+        # Keep the first row per primary key, as INSERT IGNORE would
+        primary_key = TABLES[table_name]['primary_key']
+        duplicates = df.duplicated(subset=primary_key)
+        if duplicates.any():
+            print(f"Warning: {duplicates.sum()} rows with duplicate primary keys skipped in {table_name}")
+            df = df[~duplicates]
+        df.rename(columns=rename_map(table_name), inplace=True)
+
+        data = [tuple(row) for row in df.to_numpy()]
+        columns = ', '.join([f'`{col}`' for col in df.columns])
+        placeholders = ', '.join(['%s'] * len(df.columns))
+        insert_sql = f"INSERT INTO {staging_table} ({columns}) VALUES ({placeholders})"
+
+        # Load into a fresh staging table without indexes or constraint checks
+        cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+        cursor.execute(create_table_sql(table_name, target=staging_table, constraints=False))
+        cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+        for start in range(0, len(data), batch_size):
+            cursor.executemany(insert_sql, data[start:start + batch_size])
+        connection.commit()
+
+        # Build all keys in one pass, then swap the staging table in
+        cursor.execute(add_constraints_sql(table_name, staging_table))
+        cursor.execute(f"DROP TABLE IF EXISTS {old_table}")
+        cursor.execute(f"RENAME TABLE {table_name} TO {old_table}, {staging_table} TO {table_name}")
+        cursor.execute(f"DROP TABLE {old_table}")
+        print(f"Data bulk loaded successfully into {table_name} ({len(data)} rows)")
+
+    except Error as e:
+        print(f"Error bulk loading data into {table_name}: {e}")
+        # The connection may be gone, so cleanup errors must not hide the one above
+        if cursor:
+            try:
+                cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+            except Error as cleanup_error:
+                print(f"Error dropping {staging_table}: {cleanup_error}")
+    finally:
+        if cursor:
+            try:
+                cursor.execute("SET SESSION foreign_key_checks = 1, unique_checks = 1")
+                cursor.close()
+            except Error as cleanup_error:
+                print(f"Error restoring session checks after loading {table_name}: {cleanup_error}")
+
 def main():
     # Create a database connection
     connection = create_connection()
@@ -208,7 +192,10 @@ def main():
             load_data(connection, 'Time_Dim', 'data/transformed/time_dim.csv')
             load_data(connection, 'Shipping_Dim', 'data/transformed/shipping_dim.csv')
             
-            load_data(connection, 'Sales_Fact', 'data/transformed/sales_fact.csv')
+            if BULK_LOAD:
+                bulk_load_data(connection, 'Sales_Fact', 'data/transformed/sales_fact.csv')
+            else:
+                load_data(connection, 'Sales_Fact', 'data/transformed/sales_fact.csv')
         except Error as e:
             print(f"Error during data loading: {e}")
         finally:
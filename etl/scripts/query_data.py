@@ -0,0 +1,150 @@
+import pandas as pd
+import os
+from collections import OrderedDict
+from schema import TABLES, read_table, rename_map
+
+TRANSFORMED_FILES = {
+    'Customer_Dim': 'data/transformed/customer_dim.csv',
+    'Product_Dim': 'data/transformed/product_dim.csv',
+    'Time_Dim': 'data/transformed/time_dim.csv',
+    'Shipping_Dim': 'data/transformed/shipping_dim.csv',
+    'Sales_Fact': 'data/transformed/sales_fact.csv',
+}
+
+# Measures of Sales_Fact and how they are aggregated
+MEASURES = {
+    'Sales': 'sum',
+    'Profit': 'sum',
+    'Quantity': 'sum',
+    'Discount': 'mean',
+    'ShippingCost': 'sum',
+}
+
+# Upper bound on the memory held by cached query results
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Joined star schema, the file versions it was built from and the LRU result cache
+_state = {'version': None, 'cube': None, 'cache': OrderedDict(), 'cache_bytes': 0}
+
+
+def data_version():
+    """Return the modification time and size of every transformed file."""
+    version = []
+    for path in TRANSFORMED_FILES.values():
+        stat = os.stat(path)
+        version.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+def load_cube():
+    """Join Sales_Fact with its dimensions into one dictionary-encoded frame.
+
+    Column names are the MySQL names (e.g. ShippingCost, SubCategory) and every
+    dimension attribute is stored as a categorical.
+    """
+    tables = {}
+    for table_name, path in TRANSFORMED_FILES.items():
+        df = read_table(path, table_name, 'transformed')
+        tables[table_name] = df.rename(columns=rename_map(table_name))
+
+    cube = tables['Sales_Fact']
+    for table_name, dim in tables.items():
+        if table_name == 'Sales_Fact':
+            continue
+        keys = [rename_map(table_name)[col] for col in TABLES[table_name]['primary_key']]
+        # The fact table already carries its own measures (e.g. ShippingCost)
+        dim = dim.drop(columns=[col for col in dim.columns if col in MEASURES])
+        cube = cube.merge(dim, on=keys, how='left')
+
+    for col in cube.columns:
+        if col not in MEASURES:
+            cube[col] = cube[col].astype('category')
+    return cube
+
+
+def invalidate():
+    """Drop the joined star schema and every cached result."""
+    _state['version'] = None
+    _state['cube'] = None
+    _state['cache'].clear()
+    _state['cache_bytes'] = 0
+
+
+def get_cube():
+    """Return the joined star schema, reloading it when a new load has landed."""
+    version = data_version()
+    if version != _state['version']:
+        invalidate()
+        _state['cube'] = load_cube()
+        _state['version'] = version
+    return _state['cube']
+
+
+def cache_key(measures, by, filters):
+    """Build a hashable key that ignores filter ordering."""
+    normalized = []
+    for col, values in sorted(filters.items()):
+        if isinstance(values, (list, tuple, set)):
+            values = tuple(sorted(values, key=str))
+        else:
+            values = (values,)
+        normalized.append((col, values))
+    return (tuple(measures), tuple(by), tuple(normalized))
+
+
+def cache_result(key, result):
+    """Store a result, evicting least recently used results over CACHE_MAX_BYTES."""
+    size = int(result.memory_usage(deep=True).sum())
+    if size > CACHE_MAX_BYTES:
+        return
+    cache = _state['cache']
+    cache[key] = (result, size)
+    _state['cache_bytes'] += size
+    while _state['cache_bytes'] > CACHE_MAX_BYTES:
+        _, (_, evicted_size) = cache.popitem(last=False)
+        _state['cache_bytes'] -= evicted_size
+
+
+def query(measures, by=None, filters=None):
+    """Aggregate measures over the star schema.
+
+    measures are Sales_Fact measures (see MEASURES), by is a list of dimension
+    attributes to group by and filters maps an attribute to a value or a list
+    of allowed values, e.g.
+    query(['Sales', 'Profit'], by=['Region', 'OrderYear'], filters={'Segment': 'Consumer'}).
+    """
+    by = list(by or [])
+    filters = filters or {}
+    unknown = [m for m in measures if m not in MEASURES]
+    if unknown:
+        raise ValueError(f"Unknown measures: {unknown}")
+
+    cube = get_cube()
+    key = cache_key(measures, by, filters)
+    cache = _state['cache']
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key][0].copy()
+
+    # Filters and group-bys operate on the categorical codes
+    mask = pd.Series(True, index=cube.index)
+    for col, values in filters.items():
+        if not isinstance(values, (list, tuple, set)):
+            values = [values]
+        mask &= cube[col].isin(values)
+    selected = cube.loc[mask, by + list(measures)]
+
+    # Aggregate in 64 bits whatever the storage dtype, so totals stay exact
+    selected = selected.astype({
+        m: 'int64' if pd.api.types.is_integer_dtype(selected[m]) else 'float64'
+        for m in measures
+    })
+
+    aggregations = {m: MEASURES[m] for m in measures}
+    if by:
+        result = selected.groupby(by, observed=True).agg(aggregations).reset_index()
+    else:
+        result = selected.agg(aggregations).to_frame().T.reset_index(drop=True)
+
+    cache_result(key, result)
+    return result.copy()
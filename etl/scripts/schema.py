@@ -0,0 +1,223 @@
+import numpy as np
+import pandas as pd
+
+# ---- Schema Registry ----
+# Every column used by the pipeline, keyed by its source (CSV/Excel) name:
+# (MySQL column name, pandas dtype, MySQL type)
+# Integers and low-cardinality strings are downcast; money stays float64 since
+# float32 cannot hold DECIMAL(10, 2) cents above ~131k or sum them exactly.
+COLUMNS = {
+    'Customer ID': ('CustomerID', 'object', 'VARCHAR(50)'),
+    'Customer Name': ('CustomerName', 'object', 'VARCHAR(255)'),
+    'Segment': ('Segment', 'category', 'VARCHAR(50)'),
+    'City': ('City', 'category', 'VARCHAR(50)'),
+    'State': ('State', 'category', 'VARCHAR(50)'),
+    'Country': ('Country', 'category', 'VARCHAR(50)'),
+    'Region': ('Region', 'category', 'VARCHAR(50)'),
+    'Product ID': ('ProductID', 'object', 'VARCHAR(50)'),
+    'Product Name': ('ProductName', 'object', 'VARCHAR(255)'),
+    'Category': ('Category', 'category', 'VARCHAR(50)'),
+    'Sub-Category': ('SubCategory', 'category', 'VARCHAR(50)'),
+    'Order Date': ('OrderDate', 'datetime64[ns]', 'DATE'),
+    'order year': ('OrderYear', 'int16', 'INT'),
+    'order month': ('OrderMonth', 'int8', 'INT'),
+    'Order ID': ('OrderID', 'object', 'VARCHAR(50)'),
+    'Ship Date': ('ShipDate', 'datetime64[ns]', 'DATE'),
+    'Ship Mode': ('ShipMode', 'category', 'VARCHAR(50)'),
+    'Delivery Days': ('DeliveryDays', 'int16', 'INT'),
+    'Shipping Cost': ('ShippingCost', 'float64', 'DECIMAL(10, 2)'),
+    'Sales': ('Sales', 'float64', 'DECIMAL(10, 2)'),
+    'Profit': ('Profit', 'float64', 'DECIMAL(10, 2)'),
+    'Quantity': ('Quantity', 'int16', 'INT'),
+    'Discount': ('Discount', 'float64', 'DECIMAL(5, 2)'),
+    'Forecast Date': ('ForecastDate', 'datetime64[ns]', 'DATE'),
+    'Model Version': ('ModelVersion', 'object', 'VARCHAR(64)'),
+    'Predicted Sales': ('PredictedSales', 'float64', 'DECIMAL(12, 2)'),
+    'Created At': ('CreatedAt', 'datetime64[ns]', 'TIMESTAMP DEFAULT CURRENT_TIMESTAMP'),
+}
+
+# Source tables as extracted (raw/staging) and cleaned (processed)
+SOURCES = {
+    'customers': ['Customer ID', 'Customer Name', 'Segment', 'City', 'State', 'Country', 'Region'],
+    'products': ['Product ID', 'Product Name', 'Category', 'Sub-Category'],
+    'sales': ['Order ID', 'Product ID', 'Customer ID', 'Order Date', 'Sales', 'Profit', 'Quantity', 'Discount'],
+    'shipping': ['Order ID', 'Ship Date', 'Ship Mode', 'Delivery Days', 'Shipping Cost'],
+    'time': ['Order Date', 'order year', 'order month'],
+}
+
+# Star schema tables (transformed CSVs and MySQL), in load order. Forecast_Fact
+# is written by ml/forecast_sales.py rather than loaded from a CSV. As in the
+# original hand-written DDL only key columns are NOT NULL; validate_data()
+# checks the others for missing values before loading.
+TABLES = {
+    'Customer_Dim': {
+        'columns': ['Customer ID', 'Customer Name', 'Segment', 'City', 'State', 'Country', 'Region'],
+        'primary_key': ['Customer ID'],
+        'foreign_keys': {},
+        'nullable': ['Customer Name', 'Segment', 'City', 'State', 'Country', 'Region'],
+    },
+    'Product_Dim': {
+        'columns': ['Product ID', 'Product Name', 'Category', 'Sub-Category'],
+        'primary_key': ['Product ID'],
+        'foreign_keys': {},
+        'nullable': ['Product Name', 'Category', 'Sub-Category'],
+    },
+    'Time_Dim': {
+        'columns': ['Order Date', 'order year', 'order month'],
+        'primary_key': ['Order Date'],
+        'foreign_keys': {},
+        'nullable': ['order year', 'order month'],
+    },
+    'Shipping_Dim': {
+        'columns': ['Order ID', 'Ship Date', 'Ship Mode', 'Delivery Days', 'Shipping Cost'],
+        'primary_key': ['Order ID'],
+        'foreign_keys': {},
+        'nullable': ['Ship Date', 'Ship Mode', 'Delivery Days', 'Shipping Cost'],
+    },
+    'Sales_Fact': {
+        'columns': [
+            'Order ID', 'Product ID', 'Customer ID', 'Order Date',
+            'Sales', 'Profit', 'Quantity', 'Discount', 'Shipping Cost'
+        ],
+        'primary_key': ['Order ID', 'Product ID', 'Customer ID', 'Order Date'],
+        # source column: referenced dimension (joined on its primary key)
+        'foreign_keys': {
+            'Customer ID': 'Customer_Dim',
+            'Product ID': 'Product_Dim',
+            'Order Date': 'Time_Dim',
+            'Order ID': 'Shipping_Dim',
+        },
+        'nullable': ['Sales', 'Profit', 'Quantity', 'Discount', 'Shipping Cost'],
+    },
+    'Forecast_Fact': {
+        'columns': ['Forecast Date', 'Segment', 'Model Version', 'Predicted Sales', 'Created At'],
+        'primary_key': ['Forecast Date', 'Segment', 'Model Version'],
+        'foreign_keys': {},
+        'nullable': ['Created At'],
+    },
+}
+
+# Raw extracts keep dates as 'dd-mm-YYYY' text and may contain gaps or stray
+# text that clean_data() imputes or coerces, so their numbers are left to type
+# inference and their dates are read as text.
+RAW_STAGES = ('raw', 'staging')
+
+
+def table_columns(name):
+    """Return the source column names of a source or star schema table."""
+    if name in SOURCES:
+        return SOURCES[name]
+    return TABLES[name]['columns']
+
+
+def dtypes(name):
+    """Return the pandas dtype of every column of a table."""
+    return {col: COLUMNS[col][1] for col in table_columns(name)}
+
+
+def read_options(name, stage, parse_dates=True):
+    """Build usecols/dtype/parse_dates keyword arguments for reading a table.
+
+    Works for both pd.read_csv and pd.read_excel. Dates are left as text for
+    raw/staging files and when parse_dates is False. Integers are read as
+    int64; use read_table() to downcast them after a range check.
+    """
+    dtype = {}
+    dates = []
+    for col, pandas_dtype in dtypes(name).items():
+        if pandas_dtype.startswith('datetime'):
+            if stage in RAW_STAGES or not parse_dates:
+                dtype[col] = 'object'
+            else:
+                dates.append(col)
+        elif stage in RAW_STAGES and pandas_dtype.startswith(('int', 'float')):
+            # Inferred as in the source: 221 stays 221, gaps give floats and
+            # stray text gives objects, all of which cleaning coerces
+            continue
+        elif pandas_dtype.startswith('int'):
+            dtype[col] = 'int64'
+        else:
+            dtype[col] = pandas_dtype
+
+    options = {'usecols': table_columns(name), 'dtype': dtype}
+    if dates:
+        options['parse_dates'] = dates
+    return options
+
+
+def read_table(path, name, stage, parse_dates=True):
+    """Read a processed or transformed CSV with the registry dtypes."""
+    df = pd.read_csv(path, **read_options(name, stage, parse_dates))
+    if not parse_dates:
+        # Keep the dates as text (e.g. for MySQL DATE columns)
+        return cast(df, name, exclude_dates=True)
+    return cast(df, name)
+
+
+def cast(df, name, exclude_dates=False):
+    """Cast a DataFrame to the registry dtypes of a table.
+
+    Integer columns are rounded and range-checked before being downcast, so a
+    value that does not fit raises ValueError instead of wrapping around.
+    """
+    types = dtypes(name)
+    if exclude_dates:
+        types = {col: dtype for col, dtype in types.items() if not dtype.startswith('datetime')}
+
+    df = df.copy()
+    for col, dtype in types.items():
+        if not dtype.startswith('int'):
+            continue
+        values = pd.to_numeric(df[col])
+        if pd.api.types.is_float_dtype(values):
+            if values.isnull().any():
+                raise ValueError(f"Missing values in integer column {col} of {name}")
+            values = values.round()
+        limits = np.iinfo(dtype)
+        if ((values < limits.min) | (values > limits.max)).any():
+            raise ValueError(f"Values of {col} in {name} outside the {dtype} range [{limits.min}, {limits.max}]")
+        df[col] = values
+    return df.astype(types)
+
+
+def rename_map(table_name):
+    """Return the source -> MySQL column name mapping of a star schema table."""
+    return {col: COLUMNS[col][0] for col in TABLES[table_name]['columns']}
+
+
+def constraint_definitions(table_name):
+    """Return the PRIMARY KEY and FOREIGN KEY clauses of a star schema table."""
+    table = TABLES[table_name]
+    primary_key = ', '.join(COLUMNS[col][0] for col in table['primary_key'])
+    definitions = [f"PRIMARY KEY ({primary_key})"]
+
+    for col, ref_table in table['foreign_keys'].items():
+        ref_key = ', '.join(COLUMNS[ref][0] for ref in TABLES[ref_table]['primary_key'])
+        definitions.append(f"FOREIGN KEY ({COLUMNS[col][0]}) REFERENCES {ref_table}({ref_key})")
+    return definitions
+
+
+def create_table_sql(table_name, target=None, constraints=True):
+    """Generate the MySQL CREATE TABLE statement of a star schema table.
+
+    target creates the same columns under another name; constraints=False
+    leaves out the keys (see add_constraints_sql).
+    """
+    table = TABLES[table_name]
+    definitions = []
+    for col in table['columns']:
+        mysql_name, _, mysql_type = COLUMNS[col]
+        null = '' if col in table['nullable'] else ' NOT NULL'
+        definitions.append(f"{mysql_name} {mysql_type}{null}")
+
+    if constraints:
+        definitions.extend(constraint_definitions(table_name))
+
+    body = ',\n    '.join(definitions)
+    return f"CREATE TABLE IF NOT EXISTS {target or table_name} (\n    {body}\n)"
+
+
+def add_constraints_sql(table_name, target):
+    """Generate one ALTER TABLE adding a table's keys to an unindexed copy."""
+    clauses = ',\n    '.join(f"ADD {definition}" for definition in constraint_definitions(table_name))
+    return f"ALTER TABLE {target}\n    {clauses}"
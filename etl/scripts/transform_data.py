@@ -1,165 +1,301 @@
 import pandas as pd
+import os
+import time as timer
+from concurrent.futures import ProcessPoolExecutor
+from schema import read_options, read_table, cast, TABLES
+
+# Process pool size for clean_data() (unset uses every core on the host)
+MAX_WORKERS = int(os.getenv('ETL_MAX_WORKERS', 0)) or None
+
+# Row-range shards per table for clean_data(); set above 1 to split a large
+# table across workers. Tables not listed are cleaned whole.
+SHARDS = {'sales': int(os.getenv('ETL_SALES_SHARDS', 1))}
+
+STAGING_FILES = {
+    'customers': 'data/staging/customers_raw.xlsx',
+    'shipping': 'data/staging/shipping_raw.xlsx',
+    'products': 'data/staging/products_raw.csv',
+    'sales': 'data/staging/sales_raw.csv',
+    'time': 'data/staging/time_raw.csv',
+}
+
+PROCESSED_FILES = {
+    'customers': 'data/processed/customers_cleaned.csv',
+    'shipping': 'data/processed/shipping_cleaned.csv',
+    'products': 'data/processed/products_cleaned.csv',
+    'sales': 'data/processed/sales_cleaned.csv',
+    'time': 'data/processed/time_cleaned.csv',
+}
+
+
+# Function to check and handle missing data
+def handle_missing_data(df, name):
+    print(f"Missing values in {name}:")
+    print(df.isnull().sum())
+    
+    # Fill missing values based on column type
+    for col in df.columns:
+        if df[col].dtype in ['object', 'category']:  
+            mode_value = df[col].mode()[0]  
+            df[col] = df[col].fillna(mode_value)
+        elif pd.api.types.is_numeric_dtype(df[col]):  
+            if df[col].skew() > 1:  
+                median_value = df[col].median()
+                df[col] = df[col].fillna(median_value)
+            else:  
+                mean_value = df[col].mean()
+                df[col] = df[col].fillna(mean_value)
+    
+    print(f"Missing values in {name} after handling:")
+    print(df.isnull().sum())
+    return df
+
+
+# ---- Data Cleaning ----
+
+# 1--- cleaning customers data
+def clean_customers(customers):
+    # Standardize text
+    customers['Customer Name'] = customers['Customer Name'].str.title()
+
+    # Handle missing values
+    customers = handle_missing_data(customers, 'customers')
+
+    # Trim whitespace
+    customers['City'] = customers['City'].str.strip()
+    customers['State'] = customers['State'].str.strip()
+    customers['Country'] = customers['Country'].str.strip()
+    customers['Region'] = customers['Region'].str.strip()
+
+    # Validate 'Segment' column
+    valid_segments = ['Consumer', 'Corporate', 'Home Office']
+    customers['Segment'] = customers['Segment'].apply(lambda x: x if x in valid_segments else 'Unknown')
+
+    # Standardize 'Country' and 'Region' values
+    customers['Country'] = customers['Country'].str.upper()
+    customers['Region'] = customers['Region'].str.upper()
+    return customers
+
+
+# 2--- cleaning shipping data
+def clean_shipping(shipping):
+    # Convert 'Ship Date' to datetime
+    shipping['Ship Date'] = pd.to_datetime(shipping['Ship Date'], format='%d-%m-%Y', errors='coerce')
+
+    # Handle missing values
+    shipping = handle_missing_data(shipping, 'shipping')
+
+    # Validate 'Ship Mode' column
+    valid_ship_modes = ['First Class', 'Second Class', 'Standard Class', 'Same Day']
+    shipping['Ship Mode'] = shipping['Ship Mode'].apply(lambda x: x if x in valid_ship_modes else 'Unknown')
+
+    # Validate 'Delivery Days' (ensure non-negative)
+    shipping['Delivery Days'] = pd.to_numeric(shipping['Delivery Days'], errors='coerce')
+    shipping['Delivery Days'] = shipping['Delivery Days'].clip(lower=0)
+
+    # Validate 'Shipping Cost' (ensure non-negative)
+    shipping['Shipping Cost'] = pd.to_numeric(shipping['Shipping Cost'], errors='coerce')
+    shipping['Shipping Cost'] = shipping['Shipping Cost'].clip(lower=0)
+    return shipping
+
+
+# 3--- Cleaning products data
+def clean_products(products):
+    # Handle missing values
+    products = handle_missing_data(products, 'products')
+
+    # Standardize text
+    products['Product Name'] = products['Product Name'].str.strip().str.title()
+    products['Category'] = products['Category'].str.strip().str.title()
+    products['Sub-Category'] = products['Sub-Category'].str.strip().str.title()
+    return products
+
+
+# 4--- Cleaning sales data
+def parse_sales_dates(sales):
+    # Debug: Inspect raw 'Order Date' values in sales
+    print("Unique 'Order Date' values in raw sales data:")
+    print(sales['Order Date'].unique())
+
+    # Convert 'Order Date' to datetime
+    sales['Order Date'] = pd.to_datetime(sales['Order Date'], format='%d-%m-%Y', errors='coerce')
+
+    # Debug: Inspect rows with missing 'Order Date' after conversion
+    missing_order_dates_sales = sales[sales['Order Date'].isnull()]
+    print("Rows with missing 'Order Date' in sales after conversion:")
+    print(missing_order_dates_sales)
+    return sales
 
-def clean_data():
-        # Load raw data from staging area
-        products = pd.read_csv('data/staging/products_raw.csv')
-        sales = pd.read_csv('data/staging/sales_raw.csv')
-        time = pd.read_csv('data/staging/time_raw.csv')
-
-        customers = pd.read_excel('data/staging/customers_raw.xlsx')
-        shipping = pd.read_excel('data/staging/shipping_raw.xlsx')
-
-        # Function to check and handle missing data
-        def handle_missing_data(df, name):
-            print(f"Missing values in {name}:")
-            print(df.isnull().sum())
-            
-            # Fill missing values based on column type
-            for col in df.columns:
-                if df[col].dtype == 'object':  
-                    mode_value = df[col].mode()[0]  
-                    df[col] = df[col].fillna(mode_value)
-                elif df[col].dtype in ['int64', 'float64']:  
-                    if df[col].skew() > 1:  
-                        median_value = df[col].median()
-                        df[col] = df[col].fillna(median_value)
-                    else:  
-                        mean_value = df[col].mean()
-                        df[col] = df[col].fillna(mean_value)
-            
-            print(f"Missing values in {name} after handling:")
-            print(df.isnull().sum())
-            return df
-
-        # ---- Data Cleaning ----
-
-        # 1--- cleaning customers data
-        # Standardize text
-        customers['Customer Name'] = customers['Customer Name'].str.title()
-
-        # Handle missing values
-        customers = handle_missing_data(customers, 'customers')
-
-        # Trim whitespace
-        customers['City'] = customers['City'].str.strip()
-        customers['State'] = customers['State'].str.strip()
-        customers['Country'] = customers['Country'].str.strip()
-        customers['Region'] = customers['Region'].str.strip()
-
-        # Validate 'Segment' column
-        valid_segments = ['Consumer', 'Corporate', 'Home Office']
-        customers['Segment'] = customers['Segment'].apply(lambda x: x if x in valid_segments else 'Unknown')
-
-        # Standardize 'Country' and 'Region' values
-        customers['Country'] = customers['Country'].str.upper()
-        customers['Region'] = customers['Region'].str.upper()
-
-        # 2--- cleaning shipping data
-        # Convert 'Ship Date' to datetime
-        shipping['Ship Date'] = pd.to_datetime(shipping['Ship Date'], format='%d-%m-%Y', errors='coerce')
-
-        # Handle missing values
-        shipping = handle_missing_data(shipping, 'shipping')
-
-        # Validate 'Ship Mode' column
-        valid_ship_modes = ['First Class', 'Second Class', 'Standard Class', 'Same Day']
-        shipping['Ship Mode'] = shipping['Ship Mode'].apply(lambda x: x if x in valid_ship_modes else 'Unknown')
-
-        # Validate 'Delivery Days' (ensure non-negative)
-        shipping['Delivery Days'] = pd.to_numeric(shipping['Delivery Days'], errors='coerce')
-        shipping['Delivery Days'] = shipping['Delivery Days'].clip(lower=0)
-
-        # Validate 'Shipping Cost' (ensure non-negative)
-        shipping['Shipping Cost'] = pd.to_numeric(shipping['Shipping Cost'], errors='coerce')
-        shipping['Shipping Cost'] = shipping['Shipping Cost'].clip(lower=0)
-        
-        
-        # 3--- Cleaning products data
-        # Handle missing values
-        products = handle_missing_data(products, 'products')
-
-        # Standardize text
-        products['Product Name'] = products['Product Name'].str.strip().str.title()
-        products['Category'] = products['Category'].str.strip().str.title()
-        products['Sub-Category'] = products['Sub-Category'].str.strip().str.title()
-
-        # 4--- Cleaning sales data
-        # Debug: Inspect raw 'Order Date' values in sales
-        print("Unique 'Order Date' values in raw sales data:")
-        print(sales['Order Date'].unique())
-
-        # Convert 'Order Date' to datetime
-        sales['Order Date'] = pd.to_datetime(sales['Order Date'], format='%d-%m-%Y', errors='coerce')
-
-        # Debug: Inspect rows with missing 'Order Date' after conversion
-        missing_order_dates_sales = sales[sales['Order Date'].isnull()]
-        print("Rows with missing 'Order Date' in sales after conversion:")
-        print(missing_order_dates_sales)
-
-        # Handle missing values
-        sales = handle_missing_data(sales, 'sales')
-
-        # Validate numerical columns
-        sales['Sales'] = pd.to_numeric(sales['Sales'], errors='coerce')
-        sales['Profit'] = pd.to_numeric(sales['Profit'], errors='coerce')
-        sales['Quantity'] = pd.to_numeric(sales['Quantity'], errors='coerce')
-        sales['Discount'] = pd.to_numeric(sales['Discount'], errors='coerce')
-
-        # Ensure non-negative values
-        sales['Sales'] = sales['Sales'].clip(lower=0)
-        sales['Profit'] = sales['Profit'].clip(lower=0)
-        sales['Quantity'] = sales['Quantity'].clip(lower=0)
-        sales['Discount'] = sales['Discount'].clip(lower=0)
-
-        # Validate logical consistency (Profit <= Sales)
-        invalid_profit = sales[sales['Profit'] > sales['Sales']]
-        if not invalid_profit.empty:
-            print("Invalid Profit values found (Profit > Sales):", invalid_profit)
-
-        # 5--- Cleaning time data
-        # Debug: Inspect raw 'Order Date' values
-        print("Unique 'Order Date' values in raw time data:")
-        print(time['Order Date'].unique())
-
-        # Convert 'Order Date' to datetime
-        time['Order Date'] = pd.to_datetime(time['Order Date'], format='%d-%m-%Y', errors='coerce')
-
-        # Debug: Inspect rows with missing 'Order Date' after conversion
-        missing_order_dates = time[time['Order Date'].isnull()]
-        print("Rows with missing 'Order Date' after conversion:")
-        print(missing_order_dates)
-
-        # Handle missing values
-        time = handle_missing_data(time, 'time')
-
-        # Validate 'order year' and 'order month'
-        time['order year'] = pd.to_numeric(time['order year'], errors='coerce')
-        time['order month'] = pd.to_numeric(time['order month'], errors='coerce')
-
-        # Ensure 'order month' is between 1 and 12
-        time['order month'] = time['order month'].clip(lower=1, upper=12)
-
-        # ---- Save Cleaned Data ----
-        customers.to_csv('data/processed/customers_cleaned.csv', index=False)
-        shipping.to_csv('data/processed/shipping_cleaned.csv', index=False)
-        products.to_csv('data/processed/products_cleaned.csv', index=False)
-        sales.to_csv('data/processed/sales_cleaned.csv', index=False)
-        time.to_csv('data/processed/time_cleaned.csv', index=False)
-
-        print("Data cleaning completed and saved to processed area.")
+
+def clean_sales(sales):
+    # Handle missing values
+    sales = handle_missing_data(sales, 'sales')
+
+    # Validate numerical columns
+    sales['Sales'] = pd.to_numeric(sales['Sales'], errors='coerce')
+    sales['Profit'] = pd.to_numeric(sales['Profit'], errors='coerce')
+    sales['Quantity'] = pd.to_numeric(sales['Quantity'], errors='coerce')
+    sales['Discount'] = pd.to_numeric(sales['Discount'], errors='coerce')
+
+    # Ensure non-negative values
+    sales['Sales'] = sales['Sales'].clip(lower=0)
+    sales['Profit'] = sales['Profit'].clip(lower=0)
+    sales['Quantity'] = sales['Quantity'].clip(lower=0)
+    sales['Discount'] = sales['Discount'].clip(lower=0)
+
+    # Validate logical consistency (Profit <= Sales)
+    invalid_profit = sales[sales['Profit'] > sales['Sales']]
+    if not invalid_profit.empty:
+        print("Invalid Profit values found (Profit > Sales):", invalid_profit)
+    return sales
+
+
+# 5--- Cleaning time data
+def clean_time(time):
+    # Debug: Inspect raw 'Order Date' values
+    print("Unique 'Order Date' values in raw time data:")
+    print(time['Order Date'].unique())
+
+    # Convert 'Order Date' to datetime
+    time['Order Date'] = pd.to_datetime(time['Order Date'], format='%d-%m-%Y', errors='coerce')
+
+    # Debug: Inspect rows with missing 'Order Date' after conversion
+    missing_order_dates = time[time['Order Date'].isnull()]
+    print("Rows with missing 'Order Date' after conversion:")
+    print(missing_order_dates)
+
+    # Handle missing values
+    time = handle_missing_data(time, 'time')
+
+    # Validate 'order year' and 'order month'
+    time['order year'] = pd.to_numeric(time['order year'], errors='coerce')
+    time['order month'] = pd.to_numeric(time['order month'], errors='coerce')
+
+    # Ensure 'order month' is between 1 and 12
+    time['order month'] = time['order month'].clip(lower=1, upper=12)
+    return time
+
+
+# Per-table cleaning as (row step, table step). Row steps only look at one row
+# at a time, so they can run on row-range shards; table steps need the whole
+# table (e.g. the missing-value statistics) and run after the shards are joined.
+CLEANING_STEPS = {
+    'customers': (None, clean_customers),
+    'shipping': (None, clean_shipping),
+    'products': (None, clean_products),
+    'sales': (parse_sales_dates, clean_sales),
+    'time': (None, clean_time),
+}
+
+
+def read_staging(name, start=0, nrows=None):
+    """Read a staged table, or the row range [start, start + nrows) of a staged CSV."""
+    path = STAGING_FILES[name]
+    if path.endswith('.xlsx'):
+        return pd.read_excel(path, **read_options(name, 'staging'))
+    return pd.read_csv(path, skiprows=range(1, start + 1), nrows=nrows, **read_options(name, 'staging'))
+
+
+def count_staging_rows(name):
+    """Count the data rows of a staged CSV (its fields contain no line breaks)."""
+    with open(STAGING_FILES[name], 'rb') as f:
+        return sum(1 for _ in f) - 1
+
+
+def clean_shard(name, start, nrows):
+    """Read one row-range shard of a staged table and run its row step.
+
+    Returns the wall-clock start time of the shard with the cleaned rows.
+    """
+    started = timer.time()
+    row_step, _ = CLEANING_STEPS[name]
+    return started, row_step(read_staging(name, start, nrows))
+
+
+def finish_table(name, df, started):
+    """Run the table step on a whole table, write it and return its metrics."""
+    _, table_step = CLEANING_STEPS[name]
+    rows_in = len(df)
+    df = table_step(df)
+
+    # Cast back to the registry dtypes (downcast ints, categoricals)
+    df = cast(df, name)
+    df.to_csv(PROCESSED_FILES[name], index=False)
+    return {
+        'table': name,
+        'rows_in': rows_in,
+        'rows_out': len(df),
+        'missing': int(df.isnull().sum().sum()),
+        'seconds': round(timer.time() - started, 3),
+    }
+
+
+def clean_table(name):
+    """Read, clean and write one staged table; returns its cleaning metrics."""
+    started = timer.time()
+    row_step, _ = CLEANING_STEPS[name]
+    df = read_staging(name)
+    if row_step is not None:
+        df = row_step(df)
+    return finish_table(name, df, started)
+
+
+def clean_data(max_workers=None, shards=None):
+    """Clean every staged table in parallel on a process pool.
+
+    The source tables share no state, so each is cleaned by its own task.
+    Tables with more than one entry in shards are read and row-cleaned as
+    row-range shards in parallel, then joined and finished in this process.
+    max_workers and shards default to MAX_WORKERS and SHARDS (ETL_MAX_WORKERS
+    and ETL_SALES_SHARDS in the environment).
+    """
+    if max_workers is None:
+        max_workers = MAX_WORKERS
+    if shards is None:
+        shards = SHARDS
+    sharded = {
+        name: count
+        for name, count in shards.items()
+        if count > 1 and CLEANING_STEPS[name][0] is not None and STAGING_FILES[name].endswith('.csv')
+    }
+
+    metrics = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # Submit the shards first so they do not queue behind the slow Excel reads
+        shard_futures = {}
+        for name, count in sharded.items():
+            total_rows = count_staging_rows(name)
+            if total_rows == 0:
+                continue
+            shard_rows = -(-total_rows // count)
+            shard_futures[name] = [
+                pool.submit(clean_shard, name, start, shard_rows)
+                for start in range(0, total_rows, shard_rows)
+            ]
+
+        table_futures = [pool.submit(clean_table, name) for name in CLEANING_STEPS if name not in shard_futures]
+
+        for name, futures in shard_futures.items():
+            results = [future.result() for future in futures]
+            started = min(shard_started for shard_started, _ in results)
+            df = pd.concat([shard for _, shard in results], ignore_index=True)
+            metrics.append(finish_table(name, df, started))
+
+        metrics.extend(future.result() for future in table_futures)
+
+    print("Cleaning metrics:")
+    print(pd.DataFrame(metrics).to_string(index=False))
+    print("Data cleaning completed and saved to processed area.")
+    return metrics
 
 
 def validate_data():
     # Load transformed data
-    customer_dim = pd.read_csv('data/transformed/customer_dim.csv')
-    product_dim = pd.read_csv('data/transformed/product_dim.csv')
-    time_dim = pd.read_csv('data/transformed/time_dim.csv')
-    shipping_dim = pd.read_csv('data/transformed/shipping_dim.csv')
-    sales_fact = pd.read_csv('data/transformed/sales_fact.csv')
-
-    # Convert 'Order Date' in time_dim to datetime format
-    time_dim['Order Date'] = pd.to_datetime(time_dim['Order Date'], format='%Y-%m-%d', errors='coerce')
-    sales_fact['Order Date'] = pd.to_datetime(sales_fact['Order Date'], format='%Y-%m-%d', errors='coerce')
+    customer_dim = read_table('data/transformed/customer_dim.csv', 'Customer_Dim', 'transformed')
+    product_dim = read_table('data/transformed/product_dim.csv', 'Product_Dim', 'transformed')
+    time_dim = read_table('data/transformed/time_dim.csv', 'Time_Dim', 'transformed')
+    shipping_dim = read_table('data/transformed/shipping_dim.csv', 'Shipping_Dim', 'transformed')
+    sales_fact = read_table('data/transformed/sales_fact.csv', 'Sales_Fact', 'transformed')
 
     # ---- Data Validation ----
 
@@ -175,10 +311,12 @@ def validate_data():
         assert table.isnull().sum().sum() == 0, f"Missing values found in {table_name}"
 
     # Check for duplicate primary keys in dimension tables
-    assert customer_dim['Customer ID'].duplicated().sum() == 0, "Duplicate Customer IDs found in Customer_Dim"
-    assert product_dim['Product ID'].duplicated().sum() == 0, "Duplicate Product IDs found in Product_Dim"
-    assert time_dim['Order Date'].duplicated().sum() == 0, "Duplicate Order Dates found in Time_Dim"
-    assert shipping_dim['Order ID'].duplicated().sum() == 0, "Duplicate Order IDs found in Shipping_Dim"
+    for table_name, table in zip(
+        ['Customer_Dim', 'Product_Dim', 'Time_Dim', 'Shipping_Dim'],
+        [customer_dim, product_dim, time_dim, shipping_dim]
+    ):
+        primary_key = TABLES[table_name]['primary_key']
+        assert table.duplicated(subset=primary_key).sum() == 0, f"Duplicate {primary_key} found in {table_name}"
 
     # 2--- Validate Fact Table
 
@@ -200,46 +338,31 @@ def validate_data():
     assert (sales_fact['Discount'] >= 0).all(), "Negative values found in Discount"
     assert (sales_fact['Shipping Cost'] >= 0).all(), "Negative values found in Shipping Cost"
 
-    # 3--- Validate Data Types
+    # 3--- Validate Value Ranges
+    # (dtypes and integer ranges are enforced by read_table when the files are read)
+
+    # Check that Time_Dim attributes agree with their date
+    assert time_dim['order month'].between(1, 12).all(), "Invalid order month in Time_Dim"
+    assert (time_dim['order year'] == time_dim['Order Date'].dt.year).all(), "order year does not match Order Date in Time_Dim"
+    assert (time_dim['order month'] == time_dim['Order Date'].dt.month).all(), "order month does not match Order Date in Time_Dim"
 
-    # Check data types in dimension tables
-    assert customer_dim['Customer ID'].dtype == 'object', "Invalid data type for Customer ID in Customer_Dim"
-    assert product_dim['Product ID'].dtype == 'object', "Invalid data type for Product ID in Product_Dim"
-    assert pd.api.types.is_datetime64_any_dtype(time_dim['Order Date']), "Invalid data type for Order Date in Time_Dim"
-    assert shipping_dim['Order ID'].dtype == 'object', "Invalid data type for Order ID in Shipping_Dim"
+    # Check shipping values
+    assert (shipping_dim['Delivery Days'] >= 0).all(), "Negative values found in Delivery Days"
+    assert (shipping_dim['Shipping Cost'] >= 0).all(), "Negative values found in Shipping Cost in Shipping_Dim"
 
-    # Check data types in the fact table
-    assert pd.api.types.is_numeric_dtype(sales_fact['Sales']), "Invalid data type for Sales in Sales_Fact"
-    assert pd.api.types.is_numeric_dtype(sales_fact['Profit']), "Invalid data type for Profit in Sales_Fact"
-    assert pd.api.types.is_numeric_dtype(sales_fact['Quantity']), "Invalid data type for Quantity in Sales_Fact"
-    assert pd.api.types.is_numeric_dtype(sales_fact['Discount']), "Invalid data type for Discount in Sales_Fact"
-    assert pd.api.types.is_numeric_dtype(sales_fact['Shipping Cost']), "Invalid data type for Shipping Cost in Sales_Fact"
+    # Check that discounts are fractions
+    assert (sales_fact['Discount'] <= 1).all(), "Discount above 1 found in Sales_Fact"
 
     print("Data validation completed. No issues found.")   
     
 
 def transform_data():
-    # Load cleaned data
-    customers = pd.read_csv('data/processed/customers_cleaned.csv')
-    products = pd.read_csv('data/processed/products_cleaned.csv')
-    sales = pd.read_csv('data/processed/sales_cleaned.csv')
-    shipping = pd.read_csv('data/processed/shipping_cleaned.csv')
-    time = pd.read_csv('data/processed/time_cleaned.csv')
-
-    # Clean the 'Order Date' column
-    sales['Order Date'] = sales['Order Date'].str.strip()
-    time['Order Date'] = time['Order Date'].str.strip()
-
-    # Debug: Inspect unique 'Order Date' values in raw data
-    print("Unique 'Order Date' values in raw sales data:")
-    print(sales['Order Date'].unique())
-
-    print("Unique 'Order Date' values in raw time data:")
-    print(time['Order Date'].unique())
-
-    # Convert 'Order Date' to datetime format in cleaned datasets
-    sales['Order Date'] = pd.to_datetime(sales['Order Date'], format='%Y-%m-%d', errors='coerce')
-    time['Order Date'] = pd.to_datetime(time['Order Date'], format='%Y-%m-%d', errors='coerce')
+    # Load cleaned data ('Order Date' and 'Ship Date' are parsed on read)
+    customers = read_table('data/processed/customers_cleaned.csv', 'customers', 'processed')
+    products = read_table('data/processed/products_cleaned.csv', 'products', 'processed')
+    sales = read_table('data/processed/sales_cleaned.csv', 'sales', 'processed')
+    shipping = read_table('data/processed/shipping_cleaned.csv', 'shipping', 'processed')
+    time = read_table('data/processed/time_cleaned.csv', 'time', 'processed')
 
     # Drop rows with NaT values in 'Order Date'
     sales = sales.dropna(subset=['Order Date'])
@@ -256,19 +379,19 @@ def transform_data():
     # 1--- Create Dimension Tables
 
     # Customer Dimension
-    customer_dim = customers[['Customer ID', 'Customer Name', 'Segment', 'City', 'State', 'Country', 'Region']]
-    customer_dim = customer_dim.drop_duplicates(subset=['Customer ID'])
+    customer_dim = customers[TABLES['Customer_Dim']['columns']]
+    customer_dim = customer_dim.drop_duplicates(subset=TABLES['Customer_Dim']['primary_key'])
 
     # Product Dimension
-    product_dim = products[['Product ID', 'Product Name', 'Category', 'Sub-Category']]
-    product_dim = product_dim.drop_duplicates(subset=['Product ID'])
+    product_dim = products[TABLES['Product_Dim']['columns']]
+    product_dim = product_dim.drop_duplicates(subset=TABLES['Product_Dim']['primary_key'])
 
     # Time Dimension
-    time_dim = time[['Order Date', 'order year', 'order month']]
-    time_dim = time_dim.drop_duplicates(subset=['Order Date'])
+    time_dim = time[TABLES['Time_Dim']['columns']]
+    time_dim = time_dim.drop_duplicates(subset=TABLES['Time_Dim']['primary_key'])
 
     # Initialize missing_time_dim as an empty DataFrame
-    missing_time_dim = pd.DataFrame(columns=['Order Date', 'order year', 'order month'])
+    missing_time_dim = pd.DataFrame(columns=TABLES['Time_Dim']['columns'])
 
     # Add missing Order Dates from sales to time_dim
     missing_dates = sales[~sales['Order Date'].isin(time_dim['Order Date'])]['Order Date'].drop_duplicates()
@@ -285,8 +408,8 @@ def transform_data():
     print(missing_time_dim)
 
     # Shipping Dimension
-    shipping_dim = shipping[['Order ID', 'Ship Date', 'Ship Mode', 'Delivery Days', 'Shipping Cost']]
-    shipping_dim = shipping_dim.drop_duplicates(subset=['Order ID'])
+    shipping_dim = shipping[TABLES['Shipping_Dim']['columns']]
+    shipping_dim = shipping_dim.drop_duplicates(subset=TABLES['Shipping_Dim']['primary_key'])
 
     # 2--- Create Fact Table
 
@@ -296,13 +419,7 @@ def transform_data():
     )
 
     # Select relevant columns for the fact table
-    sales_fact = sales_fact[[
-        'Order ID', 'Product ID', 'Customer ID', 'Order Date', 
-        'Sales', 'Profit', 'Quantity', 'Discount', 'Shipping Cost'
-    ]]
-
-    # Convert 'Order Date' in sales_fact to datetime format
-    sales_fact['Order Date'] = pd.to_datetime(sales_fact['Order Date'], format='%Y-%m-%d', errors='coerce')
+    sales_fact = sales_fact[TABLES['Sales_Fact']['columns']]
 
     # Debug: Inspect 'Order Date' in sales_fact
     print("Sample 'Order Date' values in sales_fact:")
@@ -329,6 +446,13 @@ def transform_data():
 
     # 4--- Save Transformed Data
 
+    # Cast to the registry dtypes (the Time_Dim concat widens the int columns)
+    customer_dim = cast(customer_dim, 'Customer_Dim')
+    product_dim = cast(product_dim, 'Product_Dim')
+    time_dim = cast(time_dim, 'Time_Dim')
+    shipping_dim = cast(shipping_dim, 'Shipping_Dim')
+    sales_fact = cast(sales_fact, 'Sales_Fact')
+
     # Save dimension tables
     customer_dim.to_csv('data/transformed/customer_dim.csv', index=False)
     product_dim.to_csv('data/transformed/product_dim.csv', index=False)
@@ -0,0 +1,88 @@
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+
+# Features computed from OrderDate
+CALENDAR_FEATURES = ['OrderYear', 'OrderMonth', 'DayOfWeek', 'DayOfMonth', 'WeekOfYear']
+
+# Daily aggregates supplied by the caller (SQL GROUP BY or historical profiles)
+AGGREGATE_FEATURES = ['TotalProfit', 'TotalQuantity', 'AvgDiscount', 'AvgShippingCost']
+
+# Model input order (matches the models trained before the feature pipeline)
+FEATURE_COLUMNS = (
+    'OrderYear', 'OrderMonth', 'TotalProfit', 'TotalQuantity', 'AvgDiscount',
+    'AvgShippingCost', 'DayOfWeek', 'DayOfMonth', 'WeekOfYear'
+)
+
+def to_days(dates):
+    """Convert dates to int64 days since 1970-01-01."""
+    return pd.to_datetime(dates).to_numpy().astype('datetime64[D]').astype('int64')
+
+def calendar_features(days):
+    """Compute CALENDAR_FEATURES for an array of days since 1970-01-01."""
+    dates = days.astype('datetime64[D]')
+    month_start = dates.astype('datetime64[M]')
+    year = dates.astype('datetime64[Y]').astype('int64') + 1970
+    month = month_start.astype('int64') % 12 + 1
+    day_of_month = (dates - month_start.astype('datetime64[D]')).astype('int64') + 1
+
+    # 1970-01-01 was a Thursday; Monday is 0 as with pandas .dt.dayofweek
+    day_of_week = (days + 3) % 7
+
+    # ISO week: weeks belong to the year of their Thursday
+    thursday = days - day_of_week + 3
+    iso_year_start = thursday.astype('datetime64[D]').astype('datetime64[Y]').astype('datetime64[D]').astype('int64')
+    week_of_year = (thursday - iso_year_start) // 7 + 1
+
+    return np.column_stack([year, month, day_of_week, day_of_month, week_of_year])
+
+class SalesFeatures(BaseEstimator, TransformerMixin):
+    """Turn daily rows (OrderDate plus AGGREGATE_FEATURES) into the model input.
+
+    Used as the first step of the persisted model pipeline, so training and
+    scoring build features the same way. Calendar features are computed once
+    per distinct date.
+    """
+
+    def __init__(self, columns=FEATURE_COLUMNS):
+        self.columns = columns
+
+    def fit(self, X, y=None):
+        return self
+
+    def calendar(self, days):
+        """Return the calendar features of each day, computing each distinct date once."""
+        unique_days, inverse = np.unique(days, return_inverse=True)
+        return calendar_features(unique_days)[inverse]
+
+    def transform(self, X):
+        calendar = self.calendar(to_days(X['OrderDate']))
+        features = np.empty((len(X), len(self.columns)))
+        for i, col in enumerate(self.columns):
+            if col in CALENDAR_FEATURES:
+                features[:, i] = calendar[:, CALENDAR_FEATURES.index(col)]
+            else:
+                features[:, i] = X[col].to_numpy(dtype=float)
+        return features
+
+def build_pipeline(features, model):
+    """Combine the feature step and a fitted model into the persisted pipeline."""
+    return Pipeline([('features', features), ('model', model)])
+
+def load_model(model_path, training_columns_path='training_columns.pkl'):
+    """Load a saved model pipeline.
+
+    Models saved before the feature pipeline existed are wrapped with a
+    SalesFeatures step using their training_columns.pkl.
+    """
+    model = joblib.load(model_path)
+    if isinstance(model, Pipeline):
+        return model
+    columns = tuple(joblib.load(training_columns_path))
+    # Legacy models were fitted on a DataFrame; SalesFeatures emits a NumPy
+    # array in the same column order, so drop the names sklearn would check
+    if hasattr(model, 'feature_names_in_'):
+        del model.feature_names_in_
+    return build_pipeline(SalesFeatures(columns=columns), model)
@@ -0,0 +1,165 @@
+import hashlib
+import pandas as pd
+import logging
+import os
+import sys
+from mysql.connector import Error
+from ml_sales_prediction import create_connection, load_sales_data
+from features import AGGREGATE_FEATURES, load_model
+
+# Forecast_Fact is declared in the ETL schema registry
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'etl', 'scripts'))
+from schema import create_table_sql
+
+# Saved model pipeline (feature step + model)
+MODEL_PATH = os.getenv('FORECAST_MODEL_PATH', 'best_linear_regression_model.pkl')
+
+# Number of days to forecast after the last date in Time_Dim
+FORECAST_HORIZON_DAYS = int(os.getenv('FORECAST_HORIZON_DAYS', 365))
+
+# Forecast rows cover the store-wide total plus its split by customer segment
+TOTAL_SEGMENT = 'All'
+
+def model_version(model_path):
+    """Identify a saved model by its file name and a hash of its contents."""
+    with open(model_path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:10]
+    name = os.path.splitext(os.path.basename(model_path))[0]
+    return f"{name}-{digest}"
+
+def load_horizon_start(connection):
+    """Return the first day after the last date in Time_Dim."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT MAX(OrderDate) FROM Time_Dim")
+        (last_date,) = cursor.fetchone()
+    finally:
+        cursor.close()
+    return pd.Timestamp(last_date) + pd.Timedelta(days=1)
+
+def load_segment_shares(connection):
+    """Load each customer segment's share of historical sales from the DWH."""
+    query = """
+    SELECT
+        c.Segment,
+        SUM(f.Sales) AS TotalSales
+    FROM Sales_Fact f
+    JOIN Customer_Dim c ON f.CustomerID = c.CustomerID
+    GROUP BY c.Segment;
+    """
+    try:
+        df = pd.read_sql(query, connection)
+        df['TotalSales'] = df['TotalSales'].astype(float)
+        df['Share'] = df['TotalSales'] / df['TotalSales'].sum()
+        logging.info("Segment sales shares loaded successfully from DWH")
+        return df[['Segment', 'Share']]
+    except Exception as e:
+        logging.error(f"Error loading segment sales shares from DWH: {e}")
+        return None
+
+def build_profiles(history):
+    """Average the daily aggregate features per month and day of week."""
+    history = history.copy()
+    history['OrderDate'] = pd.to_datetime(history['OrderDate'])
+    history['OrderMonth'] = history['OrderDate'].dt.month
+    history['DayOfWeek'] = history['OrderDate'].dt.dayofweek
+    history[AGGREGATE_FEATURES] = history[AGGREGATE_FEATURES].astype(float)
+
+    profiles = history.groupby(['OrderMonth', 'DayOfWeek'], as_index=False)[AGGREGATE_FEATURES].mean()
+    means = history[AGGREGATE_FEATURES].mean()
+    return profiles, means
+
+def build_horizon(start_date, days, profiles, means):
+    """Build one row of store-wide features per forecast date.
+
+    The model is trained on store-wide daily totals, so it is only scored on
+    those. The aggregate features are unknown for future dates and are taken
+    from history; the model pipeline derives the calendar features from OrderDate.
+    """
+    dates = pd.date_range(start_date, periods=days, freq='D')
+    rows = pd.DataFrame({
+        'OrderDate': dates,
+        'OrderMonth': dates.month,
+        'DayOfWeek': dates.dayofweek
+    })
+    rows = rows.merge(profiles, on=['OrderMonth', 'DayOfWeek'], how='left')
+
+    # Fall back to the overall average for calendar slots without history
+    rows[AGGREGATE_FEATURES] = rows[AGGREGATE_FEATURES].fillna(means)
+    return rows
+
+def score_horizon(model, rows, shares):
+    """Score the store-wide rows in a single batch and split them by segment.
+
+    Segment forecasts are the total times each segment's historical share of
+    sales, so they add up to the 'All' row.
+    """
+    total = rows[['OrderDate']].copy()
+    total['Segment'] = TOTAL_SEGMENT
+    # Sales are never negative, so clip the regression output at zero
+    total['PredictedSales'] = model.predict(rows[['OrderDate'] + AGGREGATE_FEATURES]).clip(min=0)
+
+    segments = total[['OrderDate', 'PredictedSales']].merge(shares, how='cross')
+    segments['PredictedSales'] = segments['PredictedSales'] * segments['Share']
+    return pd.concat([total, segments[['OrderDate', 'Segment', 'PredictedSales']]], ignore_index=True)
+
+def write_forecast(connection, forecast, version):
+    """Replace the forecast horizon of a model version in Forecast_Fact atomically."""
+    cursor = None
+    try:
+        cursor = connection.cursor()
+        cursor.execute(create_table_sql('Forecast_Fact'))
+
+        start = forecast['OrderDate'].min().date()
+        end = forecast['OrderDate'].max().date()
+        data = list(zip(
+            forecast['OrderDate'].dt.strftime('%Y-%m-%d'),
+            forecast['Segment'],
+            [version] * len(forecast),
+            forecast['PredictedSales'].round(2).astype(float)
+        ))
+
+        # Delete and insert in one transaction so readers see the old or the new horizon
+        cursor.execute(
+            "DELETE FROM Forecast_Fact WHERE ModelVersion = %s AND ForecastDate BETWEEN %s AND %s",
+            (version, start, end)
+        )
+        cursor.executemany(
+            "INSERT INTO Forecast_Fact (ForecastDate, Segment, ModelVersion, PredictedSales) VALUES (%s, %s, %s, %s)",
+            data
+        )
+        connection.commit()
+        logging.info(f"Wrote {len(data)} forecast rows for {start} to {end} (model {version})")
+    except Error as e:
+        logging.error(f"Error writing forecast to Forecast_Fact: {e}")
+        # The connection may be gone, so a failed rollback must not hide the error above
+        try:
+            connection.rollback()
+        except Error as rollback_error:
+            logging.error(f"Error rolling back the forecast write: {rollback_error}")
+    finally:
+        if cursor:
+            cursor.close()
+
+# Main execution
+if __name__ == "__main__":
+    model = load_model(MODEL_PATH)
+    version = model_version(MODEL_PATH)
+
+    connection = create_connection()
+    if connection:
+        history = load_sales_data(connection)
+        shares = load_segment_shares(connection)
+
+        if history is not None and shares is not None:
+            profiles, means = build_profiles(history)
+
+            start_date = load_horizon_start(connection)
+            rows = build_horizon(start_date, FORECAST_HORIZON_DAYS, profiles, means)
+            forecast = score_horizon(model, rows, shares)
+            write_forecast(connection, forecast, version)
+        else:
+            logging.error("Failed to load sales data from DWH.")
+        connection.close()
+    else:
+        logging.error("Failed to connect to the database.")
@@ -9,6 +9,7 @@ from sklearn.metrics import mean_squared_error, mean_absolute_error
 import joblib
 import logging
 from datetime import datetime
+from features import SalesFeatures, build_pipeline
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -60,20 +61,15 @@ def load_sales_data(connection):
         logging.error(f"Error loading sales data from DWH: {e}")
         return None
 
-def preprocess_data(df):
-    """Preprocess the data for time-series forecasting."""
-    # Convert OrderDate to datetime
-    df['OrderDate'] = pd.to_datetime(df['OrderDate'])
-    
-    # Extract additional time-based features
-    df['DayOfWeek'] = df['OrderDate'].dt.dayofweek
-    df['DayOfMonth'] = df['OrderDate'].dt.day
-    df['WeekOfYear'] = df['OrderDate'].dt.isocalendar().week
-    
-    # Drop the original OrderDate column (not needed for training)
-    df = df.drop(columns=['OrderDate'])
-    
-    return df
+def preprocess_data(df, features):
+    """Preprocess the data for time-series forecasting.
+
+    Calendar features are derived from OrderDate by the same SalesFeatures
+    step that is saved with the model, so scoring builds them identically.
+    """
+    X = features.fit_transform(df)
+    y = df['TotalSales'].to_numpy(dtype=float)
+    return X, y
 
 def evaluate_model(model, X_test, y_test):
     """Evaluate the model and return performance metrics."""
@@ -131,12 +127,9 @@ if __name__ == "__main__":
         connection.close()
         
         if sales_data is not None:
-            # Preprocess the data
-            sales_data = preprocess_data(sales_data)
-            
-            # Split the data into features (X) and target (y)
-            X = sales_data.drop(columns=['TotalSales'])
-            y = sales_data['TotalSales']
+            # Preprocess the data into features (X) and target (y)
+            features = SalesFeatures()
+            X, y = preprocess_data(sales_data, features)
             
             # Split the data into training and testing sets
             X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
@@ -144,11 +137,8 @@ if __name__ == "__main__":
             # Train and evaluate models
             best_model, best_model_name = train_and_evaluate_models(X_train, X_test, y_train, y_test)
             
-            # Save the best model
-            save_model(best_model, f"best_{best_model_name.lower().replace(' ', '_')}_model.pkl")
-
-            # Save the training data columns
-            joblib.dump(X.columns, 'training_columns.pkl')
+            # Save the best model together with its feature pipeline
+            save_model(build_pipeline(features, best_model), f"best_{best_model_name.lower().replace(' ', '_')}_model.pkl")
         else:
             logging.error("Failed to load sales data from DWH.")
     else: